@@ -1,7 +1,9 @@
 """Tests for tit.pre.dicom2nifti — DICOM to NIfTI conversion."""
 
+import os
 import tarfile
 import zipfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,7 +11,7 @@ import pytest
 from tit.pre.dicom2nifti import (
     _convert_modality,
     _extract_archive,
-    _find_dicom_files,
+    _has_dicom_files,
     _modality_dicom_dir,
     run_dicom_to_nifti,
 )
@@ -22,27 +24,54 @@ class TestDicomDiscoveryAndArchives:
     """Tests for recursive DICOM discovery and archive extraction."""
 
     def test_finds_direct_dcm_and_dicom_files(self, tmp_path):
-        """Finds direct .dcm and .dicom files."""
+        """Detects direct .dcm and .dicom files."""
         dicom_dir = tmp_path / "dicom"
         dicom_dir.mkdir()
-        dcm = dicom_dir / "scan.dcm"
-        dicom = dicom_dir / "scan2.dicom"
-        txt = dicom_dir / "notes.txt"
-        dcm.touch()
-        dicom.touch()
-        txt.touch()
+        (dicom_dir / "scan.dcm").touch()
+        (dicom_dir / "notes.txt").touch()
 
-        assert _find_dicom_files(dicom_dir) == [dcm, dicom]
+        assert _has_dicom_files(dicom_dir) is True
 
     def test_finds_recursive_dicom_files(self, tmp_path):
-        """Finds DICOM files in nested folders."""
+        """Detects DICOM files in nested folders, case-insensitively."""
         dicom_dir = tmp_path / "dicom"
         nested = dicom_dir / "series" / "one"
         nested.mkdir(parents=True)
-        scan = nested / "scan.DICOM"
-        scan.touch()
+        (nested / "scan.DICOM").touch()
+
+        assert _has_dicom_files(dicom_dir) is True
+
+    def test_no_dicom_files_found(self, tmp_path):
+        """Returns False when only non-DICOM files exist."""
+        dicom_dir = tmp_path / "dicom"
+        nested = dicom_dir / "series"
+        nested.mkdir(parents=True)
+        (nested / "notes.txt").touch()
+
+        assert _has_dicom_files(dicom_dir) is False
+
+    def test_missing_dicom_dir(self, tmp_path):
+        """Returns False when the DICOM directory does not exist."""
+        assert _has_dicom_files(tmp_path / "missing") is False
+
+    def test_unreadable_subdir_is_skipped(self, tmp_path):
+        """An unscannable subdirectory is skipped, not fatal."""
+        dicom_dir = tmp_path / "dicom"
+        bad = dicom_dir / "bad"
+        good = dicom_dir / "good"
+        bad.mkdir(parents=True)
+        good.mkdir()
+        (good / "scan.dcm").touch()
+
+        real_scandir = os.scandir
+
+        def fake_scandir(path):
+            if Path(path) == bad:
+                raise PermissionError(path)
+            return real_scandir(path)
 
-        assert _find_dicom_files(dicom_dir) == [scan]
+        with patch(f"{MODULE}.os.scandir", side_effect=fake_scandir):
+            assert _has_dicom_files(dicom_dir) is True
 
     def test_extracts_zip_archive(self, tmp_path):
         """Safely extracts zip archives for later discovery."""
@@ -16,6 +16,7 @@ from tit.pre.utils import (
     _find_anat_files,
     _terminate_process,
     build_logger,
+    dir_has_entries,
     discover_subjects,
     ensure_dataset_descriptions,
     ensure_subject_dirs,
@@ -431,3 +432,36 @@ class TestDiscoverSubjectsAdditional:
         """Works when sourcedata directory doesn't exist."""
         result = discover_subjects(str(tmp_path))
         assert result == []
+
+
+class TestDirHasEntries:
+    """Tests for dir_has_entries."""
+
+    def test_non_empty_directory(self, tmp_path):
+        """Returns True when the directory contains an entry."""
+        (tmp_path / "scan.dcm").touch()
+        assert dir_has_entries(tmp_path) is True
+
+    def test_subdirectory_counts_as_entry(self, tmp_path):
+        """Returns True when the only entry is a subdirectory."""
+        (tmp_path / "nested").mkdir()
+        assert dir_has_entries(tmp_path) is True
+
+    def test_empty_directory(self, tmp_path):
+        """Returns False for an empty directory."""
+        assert dir_has_entries(tmp_path) is False
+
+    def test_missing_path(self, tmp_path):
+        """Returns False when the path does not exist."""
+        assert dir_has_entries(tmp_path / "missing") is False
+
+    def test_file_path(self, tmp_path):
+        """Returns False when the path is a file, not a directory."""
+        target = tmp_path / "notes.txt"
+        target.touch()
+        assert dir_has_entries(target) is False
+
+    def test_unreadable_path(self, tmp_path):
+        """Returns False when the directory cannot be scanned."""
+        with patch(f"{MODULE}.os.scandir", side_effect=PermissionError):
+            assert dir_has_entries(tmp_path) is False
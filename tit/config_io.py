@@ -116,7 +116,9 @@ def write_config_json(config: Any, prefix: str = "config") -> str:
     data = serialize_config(config)
     fd, path = tempfile.mkstemp(prefix=f"{prefix}_", suffix=".json")
     with os.fdopen(fd, "w") as f:
-        json.dump(data, f, indent=2)
+        # Serialise to one string first: json.dump streams many small
+        # writes through the file object, dumps + a single write does not.
+        f.write(json.dumps(data, indent=2))
     return path
 
 
@@ -137,8 +139,10 @@ def read_config_json(path: str) -> dict[str, Any]:
     --------
     write_config_json : Create a config JSON file from a dataclass.
     """
-    with open(path) as f:
-        return json.load(f)
+    # Read raw bytes and let json decode them directly: this skips the
+    # TextIOWrapper decode pass (json.loads accepts UTF-8 bytes since 3.6).
+    with open(path, "rb") as f:
+        return json.loads(f.read())
 
 
 # ---------------------------------------------------------------------------
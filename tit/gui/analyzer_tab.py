@@ -39,6 +39,27 @@ from tit.atlas.constants import BUILTIN_ATLASES
 from tit.paths import get_path_manager
 
 
+def _dir_contains_msh(top: str) -> bool:
+    """Return ``True`` if any ``.msh`` file exists under *top*.
+
+    Iterative ``os.scandir`` traversal that stops at the first hit, instead
+    of ``os.walk`` which enumerates every directory level before the check
+    can short-circuit.
+    """
+    stack = [top]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".msh"):
+                        return True
+        except OSError:
+            continue
+    return False
+
+
 class AnalysisThread(BaseProcessThread):
     """Background thread that runs ``tit.analyzer`` via subprocess.
 
@@ -2498,26 +2519,30 @@ class AnalyzerTab(QtWidgets.QWidget):
 
     def update_gmsh_subjects(self):
         """Update the gmsh subject dropdown with available subjects."""
+        # Repopulate silently: clear() and addItems() each emit
+        # currentTextChanged, which would cascade into the simulation and
+        # analysis refreshes (including their directory walks) several
+        # times. Refresh downstream once for the final selection instead.
+        self.gmsh_subject_combo.blockSignals(True)
         self.gmsh_subject_combo.clear()
         # Use path_manager to find subjects via m2m_dir
         subjects = self.pm.list_simnibs_subjects()
         if subjects:
             self.gmsh_subject_combo.addItems(subjects)
-            if len(subjects) == 1:
-                self.gmsh_subject_combo.setCurrentIndex(0)
-                self.update_gmsh_simulations()
+        self.gmsh_subject_combo.blockSignals(False)
+        self.update_gmsh_simulations()
 
     def update_gmsh_simulations(self):
         """Update the gmsh simulation dropdown based on selected subject."""
+        self.gmsh_sim_combo.blockSignals(True)
         self.gmsh_sim_combo.clear()
         subject_id = self.gmsh_subject_combo.currentText()
 
         simulations = self.pm.list_simulations(subject_id)
         if simulations:
             self.gmsh_sim_combo.addItems(simulations)
-            if len(simulations) == 1:
-                self.gmsh_sim_combo.setCurrentIndex(0)
-                self.update_gmsh_analyses()
+        self.gmsh_sim_combo.blockSignals(False)
+        self.update_gmsh_analyses()
 
     def update_gmsh_analyses(self):
         """Update the gmsh analysis dropdown based on selected subject and simulation."""
@@ -2528,19 +2553,16 @@ class AnalyzerTab(QtWidgets.QWidget):
         mesh_dir = self.pm.analysis_dir(subject_id, simulation_name, "mesh")
 
         mesh_analyses = []
-        if not os.path.isdir(mesh_dir):
+        try:
+            with os.scandir(mesh_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    # Check if this analysis folder contains any .msh files
+                    if entry.is_dir() and _dir_contains_msh(entry.path):
+                        mesh_analyses.append(entry.name)
+        except OSError:
             return
-        for item in os.listdir(mesh_dir):
-            item_path = os.path.join(mesh_dir, item)
-            if os.path.isdir(item_path) and not item.startswith("."):
-                # Check if this analysis folder contains any .msh files
-                has_meshes = False
-                for root, _, files in os.walk(item_path):
-                    if any(f.endswith(".msh") for f in files):
-                        has_meshes = True
-                        break
-                if has_meshes:
-                    mesh_analyses.append(item)
 
         if mesh_analyses:
             self.gmsh_analysis_combo.addItems(sorted(mesh_analyses))
@@ -54,6 +54,7 @@ This base class is designed to be reusable across all TI-Toolbox tabs and script
 import os
 import signal
 import subprocess
+from collections import deque
 from PyQt5 import QtCore
 
 from tit.gui.utils import strip_ansi_codes as _strip_ansi_codes_util
@@ -156,7 +157,7 @@ class BaseProcessThread(QtCore.QThread):
         self.process = None
         self.terminated = False
         self.returncode = None
-        self.last_output_lines = []
+        self.last_output_lines = deque(maxlen=50)
         self.input_data = None  # Optional stdin lines (list[str])
 
     def run(self):
@@ -242,31 +243,33 @@ class BaseProcessThread(QtCore.QThread):
                     except (BrokenPipeError, OSError):
                         pass
 
-            # Stream output in real-time
+            # Stream output in real-time.  Bound methods are hoisted out of
+            # the loop: these attribute lookups run once per output line on
+            # verbose subprocesses, so resolving them up-front measurably
+            # trims the per-line cost.
             if self.process.stdout:
+                strip_ansi = self._strip_ansi_codes
+                detect_type = self._detect_message_type
+                buffer_line = self.last_output_lines.append
+                emit_line = self.output_signal.emit
                 for line in iter(self.process.stdout.readline, ""):
                     if self.terminated:
                         break
 
                     if line:
                         # Clean and process the line
-                        raw_line = line.rstrip("\n")
-                        line_clean = self._strip_ansi_codes(raw_line)
-                        line_stripped = line_clean.strip()
+                        line_stripped = strip_ansi(line.rstrip("\n")).strip()
 
                         if line_stripped:
-                            self.last_output_lines.append(line_stripped)
-                            if len(self.last_output_lines) > 50:
-                                self.last_output_lines.pop(0)
-
-                            # Detect message type
-                            line_lower = line_stripped.lower()
-                            message_type = self._detect_message_type(
-                                line_stripped, line_lower
-                            )
+                            # maxlen deque evicts the oldest line in O(1);
+                            # list.pop(0) shifted the whole buffer each time.
+                            buffer_line(line_stripped)
 
-                            # Emit to GUI
-                            self.output_signal.emit(line_stripped, message_type)
+                            # Detect message type and emit to GUI
+                            message_type = detect_type(
+                                line_stripped, line_stripped.lower()
+                            )
+                            emit_line(line_stripped, message_type)
 
             # Wait for process completion if not terminated
             if not self.terminated:
@@ -317,7 +320,7 @@ class BaseProcessThread(QtCore.QThread):
             "m2m folder, simulation TI/mTI outputs, atlas/ROI files, and Docker/X11 setup."
         )
         if self.last_output_lines:
-            tail = " | ".join(self.last_output_lines[-3:])
+            tail = " | ".join(list(self.last_output_lines)[-3:])
             message += f" Last output: {tail}"
         return message
 
@@ -12,6 +12,28 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 
 from tit.gui.style import FONT_MD
 
+# Default SimNIBS tissue conductivities with literature references.
+# Module-level so the table is not rebuilt every time the dialog opens.
+_TISSUE_DATA = (
+    (1, "White Matter", 0.126, "Wagner et al., 2004"),
+    (2, "Gray Matter", 0.275, "Wagner et al., 2004"),
+    (3, "CSF", 1.654, "Wagner et al., 2004"),
+    (4, "Bone", 0.01, "Wagner et al., 2004"),
+    (5, "Scalp", 0.465, "Wagner et al., 2004"),
+    (6, "Eye balls", 0.5, "Opitz et al., 2015"),
+    (7, "Compact Bone", 0.008, "Opitz et al., 2015"),
+    (8, "Spongy Bone", 0.025, "Opitz et al., 2015"),
+    (9, "Blood", 0.6, "Gabriel et al., 2009"),
+    (10, "Muscle", 0.16, "Gabriel et al., 2009"),
+    (
+        100,
+        "Silicone Rubber",
+        29.4,
+        "NeuroConn electrodes: Wacker Elastosil R 570/60 RUSS",
+    ),
+    (500, "Saline", 1.0, "Saturnino et al., 2015"),
+)
+
 
 class ConductivityEditorDialog(QtWidgets.QDialog):
     """Editable table dialog for tissue conductivity values.
@@ -71,25 +93,7 @@ class ConductivityEditorDialog(QtWidgets.QDialog):
             QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding
         )
 
-        self.tissue_data = [
-            (1, "White Matter", 0.126, "Wagner et al., 2004"),
-            (2, "Gray Matter", 0.275, "Wagner et al., 2004"),
-            (3, "CSF", 1.654, "Wagner et al., 2004"),
-            (4, "Bone", 0.01, "Wagner et al., 2004"),
-            (5, "Scalp", 0.465, "Wagner et al., 2004"),
-            (6, "Eye balls", 0.5, "Opitz et al., 2015"),
-            (7, "Compact Bone", 0.008, "Opitz et al., 2015"),
-            (8, "Spongy Bone", 0.025, "Opitz et al., 2015"),
-            (9, "Blood", 0.6, "Gabriel et al., 2009"),
-            (10, "Muscle", 0.16, "Gabriel et al., 2009"),
-            (
-                100,
-                "Silicone Rubber",
-                29.4,
-                "NeuroConn electrodes: Wacker Elastosil R 570/60 RUSS",
-            ),
-            (500, "Saline", 1.0, "Saturnino et al., 2015"),
-        ]
+        self.tissue_data = _TISSUE_DATA
         self.table.setRowCount(len(self.tissue_data))
         for row, (number, name, value, ref) in enumerate(self.tissue_data):
             item = QtWidgets.QTableWidgetItem(str(number))
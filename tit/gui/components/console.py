@@ -6,11 +6,18 @@ Console Widget Component
 Reusable console output widget with associated controls for TI-Toolbox GUI
 """
 
-from PyQt5 import QtWidgets, QtCore
+from html import escape as _html_escape
+
+from PyQt5 import QtWidgets, QtCore, QtGui
 
 from tit.gui.style import COLOR_CONSOLE_WHITE
 from tit.gui.utils import strip_ansi_codes
 
+# Precomputed (prefix, suffix) wrap pair.  The style string is a constant,
+# so building the span with an f-string on every message just re-renders
+# the same template; a three-part concatenation is cheaper.
+_HTML_WRAP = (f'<span style="color: {COLOR_CONSOLE_WHITE};">', "</span>")
+
 
 def format_message(text: str, message_type: str = "default") -> str:
     """
@@ -23,7 +30,8 @@ def format_message(text: str, message_type: str = "default") -> str:
     Returns:
         An HTML ``<span>`` string in the default console color.
     """
-    return f'<span style="color: {COLOR_CONSOLE_WHITE};">{text}</span>'
+    prefix, suffix = _HTML_WRAP
+    return prefix + text + suffix
 
 
 def append_with_autoscroll(text_edit, html_text: str, process_events: bool = True):
@@ -74,6 +82,7 @@ class ConsoleWidget(QtWidgets.QWidget):
         min_height=200,
         max_height=None,
         custom_buttons=None,
+        max_blocks=5000,
     ):
         """
         Initialize the console widget.
@@ -85,6 +94,8 @@ class ConsoleWidget(QtWidgets.QWidget):
             min_height: Minimum height of the console in pixels
             max_height: Maximum height of the console in pixels (None for unlimited)
             custom_buttons: List of custom QPushButton widgets to add before Clear button (optional)
+            max_blocks: Maximum number of retained output lines; oldest lines
+                        are dropped beyond this (0 for unlimited)
         """
         super(ConsoleWidget, self).__init__(parent)
         self.parent = parent
@@ -101,6 +112,17 @@ class ConsoleWidget(QtWidgets.QWidget):
         self.min_height = min_height
         self.max_height = max_height
         self.custom_buttons = custom_buttons or []
+        self.max_blocks = max_blocks
+
+        # Pending HTML fragments coalesced into a single append per timer
+        # tick.  Appending (and re-entering the event loop) once per line
+        # dominates the cost of streaming subprocess output; batching
+        # collapses N document relayouts into one per frame.
+        self._pending = []
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)  # ~one display frame
+        self._flush_timer.timeout.connect(self._flush_pending)
 
         self.setup_ui()
 
@@ -163,12 +185,25 @@ class ConsoleWidget(QtWidgets.QWidget):
             }}
         """)
         self.console.setAcceptRichText(True)
+        # Console output never needs undo; disabling it avoids per-insert
+        # undo-stack bookkeeping and the memory it retains.
+        self.console.document().setUndoRedoEnabled(False)
+        # Bound the retained document size so long runs don't grow memory and
+        # relayout cost without limit; Qt drops the oldest blocks for us.
+        if self.max_blocks:
+            self.console.document().setMaximumBlockCount(self.max_blocks)
+        # Reused insertion cursor — cheaper than QTextEdit.append, which
+        # re-fetches a cursor and re-parses block state on every call.
+        self._cursor = self.console.textCursor()
+        self._cursor.movePosition(QtGui.QTextCursor.End)
         # stretch=1 ensures the QTextEdit fills all remaining vertical space
         # within whatever height the outer ConsoleWidget is given.
         layout.addWidget(self.console, 1)
 
     def clear_console(self):
         """Clear the console output."""
+        self._pending.clear()
+        self._flush_timer.stop()
         self.console.clear()
 
     def update_console(self, text, message_type="default"):
@@ -187,8 +222,14 @@ class ConsoleWidget(QtWidgets.QWidget):
         # Strip ANSI escape sequences before any formatting
         text = strip_ansi_codes(text)
 
+        # Escape markup characters so the fragment handed to Qt is always
+        # well-formed HTML: stray < / > / & in log lines would otherwise
+        # force the rich-text parser into tag recovery (and could mangle
+        # the document). Raw HTML callers should use append_html instead.
+        text = _html_escape(text, quote=False)
+
         formatted_text = format_message(text, message_type)
-        append_with_autoscroll(self.console, formatted_text, process_events=False)
+        self._enqueue(formatted_text)
 
     def append_html(self, html_text):
         """
@@ -197,7 +238,42 @@ class ConsoleWidget(QtWidgets.QWidget):
         Args:
             html_text: HTML formatted text to append
         """
-        append_with_autoscroll(self.console, html_text, process_events=True)
+        self._enqueue(html_text)
+
+    def _enqueue(self, html_text):
+        """Queue an HTML fragment for the next coalesced flush."""
+        self._pending.append(html_text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        """Append all queued fragments in a single document update."""
+        if not self._pending:
+            return
+        fragments = self._pending
+        self._pending = []
+
+        # Same scroll-preservation contract as append_with_autoscroll, but
+        # inserting through the reused cursor instead of QTextEdit.append.
+        scrollbar = self.console.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 5
+        saved_value = scrollbar.value()
+
+        # Each fragment goes into its own QTextBlock: setMaximumBlockCount
+        # only evicts whole blocks, so joining lines with <br> (a line
+        # separator, not a block boundary) would defeat the cap and grow a
+        # single ever-larger block.
+        document = self.console.document()
+        self._cursor.movePosition(QtGui.QTextCursor.End)
+        for fragment in fragments:
+            if not document.isEmpty():
+                self._cursor.insertBlock()
+            self._cursor.insertHtml(fragment)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        else:
+            scrollbar.setValue(saved_value)
 
     def get_console_widget(self):
         """Return the underlying QTextEdit console widget."""
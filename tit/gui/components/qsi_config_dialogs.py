@@ -10,6 +10,10 @@ from PyQt5 import QtWidgets
 from tit import constants as const
 from tit.gui.style import FONT_SM, FONT_HELP
 
+# Queried once at import — the host core count does not change while the
+# GUI is running, and the dialogs read it on every open.
+_CPU_COUNT = multiprocessing.cpu_count()
+
 
 class QSIPrepConfigDialog(QtWidgets.QDialog):
     """Configuration dialog for QSIPrep DWI preprocessing parameters.
@@ -62,7 +66,7 @@ class QSIPrepConfigDialog(QtWidgets.QDialog):
         resource_layout = QtWidgets.QFormLayout(resource_group)
 
         self.cpus_spin = QtWidgets.QSpinBox()
-        self.cpus_spin.setRange(1, multiprocessing.cpu_count())
+        self.cpus_spin.setRange(1, _CPU_COUNT)
         self.cpus_spin.setValue(self.config.get("cpus", inherited_cpus))
         resource_layout.addRow("CPUs:", self.cpus_spin)
 
@@ -73,7 +77,7 @@ class QSIPrepConfigDialog(QtWidgets.QDialog):
         resource_layout.addRow("Memory:", self.memory_spin)
 
         self.omp_threads_spin = QtWidgets.QSpinBox()
-        self.omp_threads_spin.setRange(1, multiprocessing.cpu_count())
+        self.omp_threads_spin.setRange(1, _CPU_COUNT)
         self.omp_threads_spin.setValue(
             self.config.get("omp_threads", const.QSI_DEFAULT_OMP_THREADS)
         )
@@ -470,7 +474,7 @@ class QSIReconConfigDialog(QtWidgets.QDialog):
         resource_layout = QtWidgets.QFormLayout(resource_group)
 
         self.cpus_spin = QtWidgets.QSpinBox()
-        self.cpus_spin.setRange(1, multiprocessing.cpu_count())
+        self.cpus_spin.setRange(1, _CPU_COUNT)
         self.cpus_spin.setValue(self.config.get("cpus", inherited_cpus))
         resource_layout.addRow("CPUs:", self.cpus_spin)
 
@@ -620,6 +620,9 @@ class ROIPickerWidget(QtWidgets.QWidget):
             spin.setRange(lo, hi)
             spin.setDecimals(2)
             spin.setValue(val)
+            # Emit roi_changed once per committed edit (Enter/focus-out/arrow),
+            # not on every keystroke while a coordinate is being typed.
+            spin.setKeyboardTracking(False)
             spin.valueChanged.connect(self.roi_changed)
             table.setCellWidget(row, col, spin)
 
@@ -467,16 +467,27 @@ class GLSurfaceWidget(OpenGLWidgetBase):
         dx = event.x() - self.lastPos.x()
         dy = event.y() - self.lastPos.y()
 
+        # Apply both axes before requesting a repaint so each drag event
+        # schedules at most one update instead of one per setter.
+        changed = False
         if event.buttons() & QtCore.Qt.LeftButton:
             # Rotation
-            self.setXRotation(self.xRot - 8 * dy)
-            self.setZRotation(self.zRot - 8 * dx)
+            x_rot = self.normalizeAngle(self.xRot - 8 * dy)
+            z_rot = self.normalizeAngle(self.zRot - 8 * dx)
+            if x_rot != self.xRot or z_rot != self.zRot:
+                self.xRot = x_rot
+                self.zRot = z_rot
+                changed = True
         elif event.buttons() & QtCore.Qt.RightButton:
             # Translation
-            self.setXTranslation(self.xTran + dx * 0.5)
-            self.setYTranslation(self.yTran + dy * 0.5)
+            if dx or dy:
+                self.xTran += dx * 0.5
+                self.yTran += dy * 0.5
+                changed = True
 
         self.lastPos = QtCore.QPoint(event.pos())
+        if changed:
+            self.update()
 
     def wheelEvent(self, event):
         """Handle mouse wheel for zoom"""
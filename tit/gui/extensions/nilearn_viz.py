@@ -612,16 +612,10 @@ class PublicationImageDialog(QtWidgets.QDialog):
         row = self.pairs_table.rowCount()
         self.pairs_table.insertRow(row)
 
-        # Subject combo
+        # Subject combo (reuse the list loaded by _load_subjects instead of
+        # re-scanning the project tree for every new row)
         subject_combo = QtWidgets.QComboBox()
-        subjects = []
-        if self.pm:
-            try:
-                subjects = self.pm.list_simnibs_subjects()
-            except Exception as e:
-                self.console.update_console(
-                    f"Error getting subjects: {str(e)}", "error"
-                )
+        subjects = self.subjects_list
         subject_combo.addItems(subjects)
         subject_combo.currentTextChanged.connect(
             lambda: self.update_sim_combo_in_row(row)
@@ -674,17 +668,10 @@ class PublicationImageDialog(QtWidgets.QDialog):
         sim_layout.addWidget(QtWidgets.QLabel("Simulation:"))
         sim_combo = QtWidgets.QComboBox()
 
-        # Get all unique simulations across all subjects
+        # Get all unique simulations across all subjects (from the cached
+        # subject list; _load_subjects is the rescan path)
         all_sims = set()
-        subjects = []
-        if self.pm:
-            try:
-                subjects = self.pm.list_simnibs_subjects()
-            except Exception as e:
-                self.console.update_console(
-                    f"Error getting subjects: {str(e)}", "error"
-                )
-                subjects = []
+        subjects = self.subjects_list
         for subject in subjects:
             all_sims.update(self.get_simulations_for_subject(subject))
         sim_combo.addItems(sorted(all_sims))
@@ -696,17 +683,7 @@ class PublicationImageDialog(QtWidgets.QDialog):
         subject_list = QtWidgets.QListWidget()
         subject_list.setSelectionMode(QtWidgets.QAbstractItemView.MultiSelection)
 
-        all_subjects = []
-        if self.pm:
-            try:
-                all_subjects = self.pm.list_simnibs_subjects()
-            except Exception as e:
-                self.console.update_console(
-                    f"Error getting subjects: {str(e)}", "error"
-                )
-                all_subjects = []
-        for subject in all_subjects:
-            subject_list.addItem(subject)
+        subject_list.addItems(subjects)
 
         layout.addWidget(subject_list)
 
@@ -766,7 +743,7 @@ class PublicationImageDialog(QtWidgets.QDialog):
 
                 # Subject combo
                 subject_combo_widget = QtWidgets.QComboBox()
-                subject_combo_widget.addItems(all_subjects)
+                subject_combo_widget.addItems(subjects)
                 subject_combo_widget.setCurrentText(subject_id)
                 subject_combo_widget.currentTextChanged.connect(
                     lambda: self.update_sim_combo_in_row(row)
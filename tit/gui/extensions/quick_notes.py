@@ -9,7 +9,9 @@ analysis. Notes persist to ``derivatives/ti-toolbox/notes.txt``.
 
 import logging
 import os
+from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 from PyQt5 import QtWidgets, QtCore
 
@@ -140,10 +142,6 @@ class NotesWindow(QtWidgets.QDialog):
 
     def _get_timestamp_with_timezone(self):
         """Get current timestamp with timezone from host machine."""
-        import os
-        from datetime import datetime
-        from zoneinfo import ZoneInfo
-
         tz_name = os.environ.get("TZ", "UTC")
         iana = (
             tz_name
@@ -257,9 +255,8 @@ class NotesWindow(QtWidgets.QDialog):
 
     def update_notes_display(self):
         """Update the notes display area."""
-        display_text = ""
-        for note in self.notes:
-            display_text += f"{note}\n\n{'-' * 70}\n\n"
+        separator = f"\n\n{'-' * 70}\n\n"
+        display_text = separator.join(self.notes) + separator if self.notes else ""
 
         self.notes_display.setPlainText(display_text)
 
@@ -184,10 +184,13 @@ class VisualExporterWidget(QtWidgets.QWidget):
         self._build_electrodes_panel()
         self._build_subcortical_panel()
 
-        self.rb_stl.toggled.connect(lambda v: self._on_mode_changed())
-        self.rb_vec.toggled.connect(lambda v: self._on_mode_changed())
-        self.rb_electrodes.toggled.connect(lambda v: self._on_mode_changed())
-        self.rb_subcortical.toggled.connect(lambda v: self._on_mode_changed())
+        # Only react to the radio being checked: switching modes fires
+        # toggled on both the old (False) and new (True) button, which
+        # would run the panel switch twice per click.
+        self.rb_stl.toggled.connect(lambda v: v and self._on_mode_changed())
+        self.rb_vec.toggled.connect(lambda v: v and self._on_mode_changed())
+        self.rb_electrodes.toggled.connect(lambda v: v and self._on_mode_changed())
+        self.rb_subcortical.toggled.connect(lambda v: v and self._on_mode_changed())
         self._on_mode_changed()
 
         # Console with Run/Stop
@@ -647,11 +650,13 @@ class VisualExporterWidget(QtWidgets.QWidget):
             line_edit.setText(path)
 
     def _regions_select_all(self, select_all: bool):
-        # Select or deselect all items in the regions list
+        # Select or deselect all items in one selection-range update
+        # instead of toggling each item individually
         try:
-            for i in range(self.cort_regions_list.count()):
-                item = self.cort_regions_list.item(i)
-                item.setSelected(select_all)
+            if select_all:
+                self.cort_regions_list.selectAll()
+            else:
+                self.cort_regions_list.clearSelection()
         except Exception:
             # GUI operations may fail during widget destruction
             pass
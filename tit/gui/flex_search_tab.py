@@ -109,6 +109,9 @@ class FlexSearchTab(QtWidgets.QWidget):
 
         # Initialize all widgets that might be referenced before setup_ui
         self.subject_list = QtWidgets.QListWidget()
+        # Rows are identical single-line entries; the uniform-size hint lets
+        # Qt skip per-item size queries on large cohorts.
+        self.subject_list.setUniformItemSizes(True)
         self.subject_list.setSelectionMode(
             QtWidgets.QAbstractItemView.ExtendedSelection
         )
@@ -532,8 +535,8 @@ class FlexSearchTab(QtWidgets.QWidget):
 
         # Get subjects using path_manager
         self.subjects = pm.list_simnibs_subjects()
-        for subject_id in self.subjects:
-            self.subject_list.addItem(subject_id)
+        # addItems inserts the whole batch with one layout/model update
+        self.subject_list.addItems(self.subjects)
 
         # Trigger EEG net refresh and atlas refresh for the first subject
         if self.subjects:
@@ -545,9 +548,8 @@ class FlexSearchTab(QtWidgets.QWidget):
 
     def select_all_subjects(self):
         """Select all subjects in the subject list."""
-        for i in range(self.subject_list.count()):
-            item = self.subject_list.item(i)
-            item.setSelected(True)
+        # One selection-range update instead of a per-item signal/repaint.
+        self.subject_list.selectAll()
 
     def clear_subject_selection(self):
         """Clear all subject selections."""
@@ -1536,8 +1538,6 @@ class FlexSearchTab(QtWidgets.QWidget):
 
     def _run_next_sweep_point(self):
         """Pop the next SweepPoint from the queue and launch a focality run for it."""
-        import os as _os
-
         if not self._sweep_queue:
             self._finalize_pareto_sweep()
             return
@@ -1549,7 +1549,7 @@ class FlexSearchTab(QtWidgets.QWidget):
         state = self._focality_state
         pm = get_path_manager()
         project_dir = pm.project_dir
-        _os.makedirs(point.output_folder, exist_ok=True)
+        os.makedirs(point.output_folder, exist_ok=True)
 
         # Build a focality FlexConfig for this sweep point
         sweep_thresholds = f"{point.nonroi_threshold:.3f},{point.roi_threshold:.3f}"
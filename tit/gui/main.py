@@ -17,6 +17,7 @@ tit.gui.extensions : Extension discovery and tab integration.
 from PyQt5 import QtWidgets, QtCore, QtGui
 
 import atexit
+import logging
 import os
 import signal
 import sys
@@ -27,6 +28,8 @@ from tit.paths import get_path_manager
 from tit.gui.style import APP_STYLESHEET
 from tit.logger import setup_logging
 
+logger = logging.getLogger(__name__)
+
 # Suppress specific SIP deprecation warning originating from PyQt/SIP internals
 warnings.filterwarnings(
     "ignore",
@@ -462,7 +465,9 @@ class MainWindow(QtWidgets.QMainWindow):
             try:
                 refresh()
             except Exception as exc:
-                print(f"Warning: could not refresh GUI data after preprocessing: {exc}")
+                logger.warning(
+                    "Could not refresh GUI data after preprocessing: %s", exc
+                )
 
     def on_analysis_completed(self, subject_id, simulation_name, analysis_type):
         """Refresh dependent tabs after an analysis run completes.
@@ -501,9 +506,36 @@ class MainWindow(QtWidgets.QMainWindow):
             self._processing_analysis_completion = False
 
 
+class _UpdateCheckThread(QtCore.QThread):
+    """Run the GitHub release check off the GUI thread.
+
+    The HTTP request can block for its full timeout when offline; doing
+    it in the startup single-shot froze input handling for that long.
+    """
+
+    update_available = QtCore.pyqtSignal(str)
+
+    def __init__(self, current_version, parent=None):
+        super().__init__(parent)
+        self.current_version = current_version
+
+    def run(self):
+        from tit.tools.check_for_update import check_for_new_version
+
+        try:
+            latest_version = check_for_new_version(self.current_version)
+        except Exception:
+            return
+        if latest_version:
+            self.update_available.emit(latest_version)
+
+
 def check_for_update(current_version, parent_window=None):
     """Check GitHub for a newer release and show a notification dialog.
 
+    The network request runs in a background thread; the dialog is shown
+    from the GUI thread when (and only when) a newer release exists.
+
     Parameters
     ----------
     current_version : str
@@ -511,15 +543,18 @@ def check_for_update(current_version, parent_window=None):
     parent_window : QWidget, optional
         Parent for the notification dialog (centered relative to it).
     """
-    from tit.tools.check_for_update import check_for_new_version
+    thread = _UpdateCheckThread(current_version, parent_window)
+    thread.update_available.connect(
+        lambda latest: _show_update_dialog(current_version, latest, parent_window)
+    )
+    thread.finished.connect(thread.deleteLater)
+    # Keep a Python-side reference so the thread survives without a parent.
+    check_for_update._thread = thread
+    thread.start()
 
-    try:
-        latest_version = check_for_new_version(current_version)
-        if not latest_version:
-            return
-    except Exception:
-        return
 
+def _show_update_dialog(current_version, latest_version, parent_window=None):
+    """Show the update-available notification dialog."""
     # Show update notification dialog
     msg_box = QtWidgets.QMessageBox(parent_window)
     msg_box.setIcon(QtWidgets.QMessageBox.Information)
@@ -625,8 +660,10 @@ def main():
 
     QtCore.QTimer.singleShot(500, lambda: assess_user_status(window))
 
-    # Check for updates after a short delay to ensure window is fully shown
-    QtCore.QTimer.singleShot(1000, lambda: check_for_update(__version__, window))
+    # Check for updates once the event loop is up; the HTTP request runs in
+    # a background thread, so no artificial delay is needed to keep the
+    # window responsive while it is shown.
+    QtCore.QTimer.singleShot(0, lambda: check_for_update(__version__, window))
 
     sys.exit(app.exec_())
 
@@ -8,6 +8,7 @@ atlas overlays, and voxel-space analysis results. Supports both single-
 subject and group visualization modes.
 """
 
+import functools
 import os
 import sys
 import glob
@@ -23,6 +24,17 @@ from tit.gui.components.console import ConsoleWidget
 ELECTRODE_OVERLAY_REGION = "Electrodes"
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_mni_atlases_cached():
+    """Scan the shipped MNI atlas resources once per process.
+
+    The resources directory is read-only toolbox content, so the probe
+    result never changes; callers re-run this on every subject/mode
+    change otherwise.
+    """
+    return tuple(VoxelAtlasManager.detect_mni_atlases(MNI_ATLAS_DIR))
+
+
 class NiftiViewerTab(QtWidgets.QWidget):
     """GUI tab for NIfTI visualization using Freeview.
 
@@ -79,7 +91,7 @@ class NiftiViewerTab(QtWidgets.QWidget):
 
     def detect_mni_atlases(self):
         """Detect available MNI atlases in resources/atlas/."""
-        return VoxelAtlasManager.detect_mni_atlases(MNI_ATLAS_DIR)
+        return list(_detect_mni_atlases_cached())
 
     def detect_voxel_analyses(self, subject_id, simulation_name):
         """Detect available voxel analyses for a subject and simulation.
@@ -748,11 +760,11 @@ class NiftiViewerTab(QtWidgets.QWidget):
         # Subject list
         layout.addWidget(QtWidgets.QLabel("Select Subjects:"))
         subject_list = QtWidgets.QListWidget()
+        subject_list.setUniformItemSizes(True)
         subject_list.setSelectionMode(QtWidgets.QAbstractItemView.MultiSelection)
 
         all_subjects = self.pm.list_simnibs_subjects()
-        for subject in all_subjects:
-            subject_list.addItem(subject)
+        subject_list.addItems(all_subjects)
 
         layout.addWidget(subject_list)
 
@@ -128,6 +128,7 @@ class PreProcessTab(QtWidgets.QWidget):
 
         # Subject list with selection
         self.subject_list = QtWidgets.QListWidget()
+        self.subject_list.setUniformItemSizes(True)
         self.subject_list.setSelectionMode(QtWidgets.QListWidget.ExtendedSelection)
         self.subject_list.setSizePolicy(
             QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding
@@ -353,8 +354,8 @@ class PreProcessTab(QtWidgets.QWidget):
 
     def update_available_subjects(self):
         """Update the list of available subjects."""
-        self.subject_list.clear()
         if self.project_dir is None:
+            self.subject_list.clear()
             QtWidgets.QMessageBox.warning(
                 self,
                 "Project Directory Not Found",
@@ -366,8 +367,19 @@ class PreProcessTab(QtWidgets.QWidget):
             )
             return
         subjects = discover_subjects(self.project_dir)
-        for subject_id in subjects:
-            self.subject_list.addItem(subject_id)
+        current = [
+            self.subject_list.item(i).text() for i in range(self.subject_list.count())
+        ]
+        if subjects != current:
+            # Rebuild only when the cohort actually changed, restoring the
+            # previous selection so a refresh doesn't drop it.
+            selected = {item.text() for item in self.subject_list.selectedItems()}
+            self.subject_list.clear()
+            self.subject_list.addItems(subjects)
+            for i in range(self.subject_list.count()):
+                item = self.subject_list.item(i)
+                if item.text() in selected:
+                    item.setSelected(True)
         if self.subject_list.count() == 0:
             QtWidgets.QMessageBox.warning(
                 self,
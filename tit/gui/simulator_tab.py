@@ -388,17 +388,15 @@ class SimulatorTab(QtWidgets.QWidget):
             self.eeg_net_combo.clear()
             subjects = self.pm.list_simnibs_subjects()
 
+            # Collect nets across subjects in one Python pass (ordered,
+            # deduplicated) instead of re-reading the combo items per file
+            seen_nets: dict[str, None] = {}
             for subject_id in subjects:
-                eeg_caps = self.pm.list_eeg_caps(subject_id)
-                for net_file in eeg_caps:
-                    if net_file not in [
-                        self.eeg_net_combo.itemText(i)
-                        for i in range(self.eeg_net_combo.count())
-                    ]:
-                        self.eeg_net_combo.addItem(net_file)
-
-            if self.eeg_net_combo.count() == 0:
-                self.eeg_net_combo.addItem("GSN-HydroCel-185.csv")
+                for net_file in self.pm.list_eeg_caps(subject_id):
+                    seen_nets[net_file] = None
+            if not seen_nets:
+                seen_nets["GSN-HydroCel-185.csv"] = None
+            self.eeg_net_combo.addItems(list(seen_nets))
 
             # Refresh subject and EEG net combos in existing job cards
             eeg_nets = [
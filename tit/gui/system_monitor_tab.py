@@ -34,6 +34,21 @@ import matplotlib.pyplot as plt
 
 plt.style.use("dark_background")  # Use dark theme for graphs
 
+# Shared highlight colour for high-CPU/high-memory table cells — built once
+# rather than per cell on every monitor tick.
+_HIGH_USAGE_COLOR = QtGui.QColor(255, 200, 200)  # light red
+
+# Path fragments marking a Python process as a toolbox script.
+_PYTHON_SCRIPT_TERMS = (
+    "ti-",
+    "gui/",
+    "pre-process/",
+    "pre/qsi/",
+    "simulator/",
+    "flex-search/",
+    "ex-search/",
+)
+
 
 class ProcessMonitorThread(QThread):
     """Background thread that polls system processes via ``psutil``.
@@ -102,6 +117,9 @@ class ProcessMonitorThread(QThread):
             "field_extract",
             "mesh2nii",
         ]
+        # is_relevant_process runs once per process per tick; pre-lowering
+        # the keywords keeps the scan to plain substring tests.
+        self._keywords_lower = tuple(kw.lower() for kw in self.relevant_keywords)
 
     def run(self):
         """Main monitoring loop."""
@@ -234,22 +252,13 @@ class ProcessMonitorThread(QThread):
         search_text = f"{proc_name} {cmdline}".lower()
 
         # Check against our keywords
-        for keyword in self.relevant_keywords:
-            if keyword.lower() in search_text:
+        for keyword in self._keywords_lower:
+            if keyword in search_text:
                 return True
 
         # Additional checks for Python processes running toolbox scripts
         if "python" in search_text and any(
-            term in search_text
-            for term in [
-                "ti-",
-                "gui/",
-                "pre-process/",
-                "pre/qsi/",
-                "simulator/",
-                "flex-search/",
-                "ex-search/",
-            ]
+            term in search_text for term in _PYTHON_SCRIPT_TERMS
         ):
             return True
 
@@ -394,6 +403,14 @@ class SystemMonitorTab(QtWidgets.QWidget):
         self.status_label.setStyleSheet("color: green; font-weight: bold;")
         main_layout.addWidget(self.status_label)
 
+        # Reused single-shot timer for restoring the status label after a
+        # manual refresh, instead of allocating a transient timer per click.
+        self._status_reset_timer = QtCore.QTimer(self)
+        self._status_reset_timer.setSingleShot(True)
+        self._status_reset_timer.timeout.connect(
+            lambda: self.status_label.setText("Monitoring active...")
+        )
+
     def setup_graphs(self):
         """Set up the matplotlib graphs for CPU and memory monitoring."""
         self.cpu_figure = Figure(figsize=(6, 3), dpi=80)
@@ -482,9 +499,7 @@ class SystemMonitorTab(QtWidgets.QWidget):
         """Manually refresh the process list."""
         if self.monitor_thread and self.monitor_thread.isRunning():
             self.status_label.setText("Refreshing...")
-            QtCore.QTimer.singleShot(
-                1000, lambda: self.status_label.setText("Monitoring active...")
-            )
+            self._status_reset_timer.start(1000)
 
     def update_system_stats(self, stats):
         """Update system-wide statistics display."""
@@ -505,7 +520,9 @@ class SystemMonitorTab(QtWidgets.QWidget):
 
     def update_graphs(self, stats):
         """Update the real-time graphs with new data."""
-        current_time = time.time()
+        # Monotonic clock: elapsed time for the x-axis must not jump when
+        # NTP adjusts the wall clock.
+        current_time = time.monotonic()
         if len(self.time_data) == 0:
             self.start_time = current_time
             relative_time = 0
@@ -516,18 +533,27 @@ class SystemMonitorTab(QtWidgets.QWidget):
         self.cpu_data.append(stats["cpu_percent"])
         self.memory_data.append(stats["memory_percent"])
 
-        times = list(self.time_data)
-        cpu_values = list(self.cpu_data)
-        memory_values = list(self.memory_data)
+        # History keeps accumulating above, but rendering a hidden tab is
+        # pure waste — the next tick repaints once the tab is shown again.
+        if not self.isVisible():
+            return
+
+        times = self.time_data
+        cpu_values = self.cpu_data
+        memory_values = self.memory_data
 
+        # Samples come from a monotonic clock, so the newest entry is the
+        # maximum and the oldest maps to the largest "seconds ago" value —
+        # no max() scan or list copies of the deques needed.
         if len(times) > 1:
-            max_time = max(times)
-            x_axis = [max_time - t for t in times]
+            latest = times[-1]
+            x_axis = [latest - t for t in times]
+            x_max = x_axis[0]
         else:
             x_axis = [0]
+            x_max = 0.0
 
         self.cpu_line.set_data(x_axis, cpu_values)
-        x_max = float(max(x_axis)) if x_axis else 60.0
         cpu_max = float(max(cpu_values)) if cpu_values else 100.0
         mem_max = float(max(memory_values)) if memory_values else 100.0
 
@@ -538,11 +564,18 @@ class SystemMonitorTab(QtWidgets.QWidget):
         self.memory_ax.set_xlim(0.0, max(60.0, x_max))
         self.memory_ax.set_ylim(0.0, max(100.0, mem_max))
 
-        self.cpu_canvas.draw()
-        self.memory_canvas.draw()
+        # draw_idle() schedules one repaint on the Qt event loop instead of
+        # rendering synchronously inside the stats slot; back-to-back updates
+        # coalesce into a single draw.
+        self.cpu_canvas.draw_idle()
+        self.memory_canvas.draw_idle()
 
     def update_process_table(self, processes):
         """Update the process table with new data."""
+        # Skip the rebuild while hidden; the next monitor tick repopulates
+        # the table as soon as the tab is visible again.
+        if not self.isVisible():
+            return
         selected_row = self.process_table.currentRow()
         selected_pid = None
         if selected_row >= 0 and self.process_table.rowCount() > selected_row:
@@ -550,6 +583,13 @@ class SystemMonitorTab(QtWidgets.QWidget):
             if pid_item:
                 selected_pid = int(pid_item.text())
 
+        # Batch the rebuild: with sorting live, every setItem can trigger a
+        # re-sort, and each cell write schedules a repaint. Suspend both and
+        # let Qt do one sort + one repaint when re-enabled.
+        sorting = self.process_table.isSortingEnabled()
+        self.process_table.setSortingEnabled(False)
+        self.process_table.setUpdatesEnabled(False)
+
         self.process_table.setRowCount(len(processes))
 
         for row, proc in enumerate(processes):
@@ -565,16 +605,12 @@ class SystemMonitorTab(QtWidgets.QWidget):
 
             cpu_item = QtWidgets.QTableWidgetItem(f"{proc['cpu_percent']:.1f}%")
             if proc["cpu_percent"] > 50:
-                cpu_item.setBackground(
-                    QtGui.QColor(255, 200, 200)
-                )  # Light red for high CPU
+                cpu_item.setBackground(_HIGH_USAGE_COLOR)
             self.process_table.setItem(row, 3, cpu_item)
 
             mem_item = QtWidgets.QTableWidgetItem(f"{proc['memory_percent']:.1f}%")
             if proc["memory_percent"] > 10:
-                mem_item.setBackground(
-                    QtGui.QColor(255, 200, 200)
-                )  # Light red for high memory
+                mem_item.setBackground(_HIGH_USAGE_COLOR)
             self.process_table.setItem(row, 4, mem_item)
 
             self.process_table.setItem(
@@ -585,6 +621,9 @@ class SystemMonitorTab(QtWidgets.QWidget):
                 row, 6, QtWidgets.QTableWidgetItem(proc["runtime"])
             )
 
+        self.process_table.setSortingEnabled(sorting)
+        self.process_table.setUpdatesEnabled(True)
+
         if selected_pid:
             for row in range(self.process_table.rowCount()):
                 pid_item = self.process_table.item(row, 0)
@@ -13,10 +13,12 @@ tit.gui.components.console : Console widget that consumes these helpers.
 tit.gui.components.base_thread : Uses ``strip_ansi_codes`` for output parsing.
 """
 
+import functools
 import logging
 import os
 import platform
 import re
+import shutil
 import subprocess
 import webbrowser
 
@@ -26,8 +28,10 @@ logger = logging.getLogger(__name__)
 # ANSI escape-code handling
 # ---------------------------------------------------------------------------
 
-# Comprehensive ANSI escape pattern covering CSI sequences AND single-char escapes.
-ANSI_ESCAPE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+# Comprehensive ANSI escape pattern covering CSI sequences AND single-char
+# escapes.  The trailing `?` also consumes a lone/stray ESC byte, so a single
+# substitution pass handles everything (no separate replace() sweep needed).
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])?")
 
 
 def strip_ansi_codes(text: str) -> str:
@@ -45,12 +49,11 @@ def strip_ansi_codes(text: str) -> str:
     str
         Cleaned text with all escape sequences removed.
     """
-    if not text:
+    # Fast path: typical log lines contain no escapes at all, and a C-level
+    # substring scan is far cheaper than entering the regex engine.
+    if not text or "\x1b" not in text:
         return text
-    cleaned = ANSI_ESCAPE_PATTERN.sub("", text)
-    # Remove any stray ESC characters that might remain
-    cleaned = cleaned.replace("\x1b", "")
-    return cleaned
+    return ANSI_ESCAPE_PATTERN.sub("", text)
 
 
 # ---------------------------------------------------------------------------
@@ -58,6 +61,20 @@ def strip_ansi_codes(text: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
+def _resolve_fallback_browser() -> str | None:
+    """Return the first browser executable found on PATH, or ``None``.
+
+    Resolved once per process with ``shutil.which`` so repeated opens do
+    not fork-and-fail through the unavailable candidates each time.
+    """
+    for browser in ("firefox", "chromium", "google-chrome", "chrome"):
+        path = shutil.which(browser)
+        if path:
+            return path
+    return None
+
+
 def open_file(file_path: str) -> None:
     """Open *file_path* in the platform default application.
 
@@ -91,12 +108,13 @@ def open_file(file_path: str) -> None:
             except (subprocess.CalledProcessError, FileNotFoundError):
                 pass
             # Fall through to browser fallback
-            for browser in ("firefox", "chromium", "google-chrome", "chrome"):
+            browser = _resolve_fallback_browser()
+            if browser:
                 try:
                     subprocess.run([browser, abs_path], check=True)
                     return
                 except (subprocess.CalledProcessError, FileNotFoundError):
-                    continue
+                    pass
         case "darwin":
             subprocess.run(["open", abs_path], check=True)
             return
@@ -310,9 +310,9 @@ class ExSearchEngine:
         roi_list = roi_dir / "roi_list.txt"
         existing = []
         if roi_list.exists():
-            existing = [
-                ln.strip() for ln in roi_list.read_text().splitlines() if ln.strip()
-            ]
+            existing = list(
+                filter(None, map(str.strip, roi_list.read_text().splitlines()))
+            )
         if roi_name not in existing:
             with open(roi_list, "a") as f:
                 f.write(f"{roi_name}\n")
@@ -335,9 +335,9 @@ class ExSearchEngine:
 
         roi_list = roi_dir / "roi_list.txt"
         if roi_list.exists():
-            lines = [
-                ln.strip() for ln in roi_list.read_text().splitlines() if ln.strip()
-            ]
+            lines = list(
+                filter(None, map(str.strip, roi_list.read_text().splitlines()))
+            )
             if roi_name in lines:
                 lines.remove(roi_name)
                 roi_list.write_text(("\n".join(lines) + "\n") if lines else "")
@@ -486,16 +486,24 @@ class PathManager:
             Returns an empty list if the SimNIBS directory does not exist.
         """
         simnibs_dir = self.simnibs() if self.project_dir else None
-        if not simnibs_dir or not os.path.isdir(simnibs_dir):
+        if not simnibs_dir:
             return []
 
         subjects = []
-        for item in os.listdir(simnibs_dir):
-            if not item.startswith(const.PREFIX_SUBJECT):
-                continue
-            sid = item.replace(const.PREFIX_SUBJECT, "", 1)
-            if os.path.isdir(self.m2m(sid)):
-                subjects.append(sid)
+        try:
+            with os.scandir(simnibs_dir) as it:
+                for entry in it:
+                    if not entry.name.startswith(const.PREFIX_SUBJECT):
+                        continue
+                    if not entry.is_dir():
+                        continue
+                    sid = entry.name.replace(const.PREFIX_SUBJECT, "", 1)
+                    # Build the m2m path from the already-resolved DirEntry
+                    # instead of re-joining the whole chain via self.m2m().
+                    if os.path.isdir(os.path.join(entry.path, f"m2m_{sid}")):
+                        subjects.append(sid)
+        except OSError:
+            return []
 
         subjects.sort(
             key=lambda x: [
@@ -15,6 +15,7 @@ See Also
 tit.pre.structural.run_pipeline : Full preprocessing pipeline.
 """
 
+import os
 import shutil
 import subprocess
 import tarfile
@@ -22,7 +23,7 @@ import zipfile
 from pathlib import Path
 
 from tit.paths import get_path_manager
-from .utils import CommandRunner, PreprocessError
+from .utils import CommandRunner, PreprocessError, dir_has_entries
 
 _ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz")
 _DICOM_SUFFIXES = (".dcm", ".dicom")
@@ -35,15 +36,24 @@ def _is_archive(path: Path) -> bool:
     return any(name.endswith(suffix) for suffix in _ARCHIVE_SUFFIXES)
 
 
-def _find_dicom_files(dicom_dir: Path) -> list[Path]:
-    """Return recursive ``.dcm`` and ``.dicom`` files under *dicom_dir*."""
-    if not dicom_dir.exists():
-        return []
-    return sorted(
-        path
-        for path in dicom_dir.rglob("*")
-        if path.is_file() and path.suffix.lower() in _DICOM_SUFFIXES
-    )
+def _has_dicom_files(dicom_dir: Path) -> bool:
+    """Return ``True`` if any ``.dcm``/``.dicom`` file exists under *dicom_dir*.
+
+    Iterative ``os.scandir`` traversal that stops at the first match;
+    presence detection does not need a full recursive listing.
+    """
+    stack = [str(dicom_dir)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(_DICOM_SUFFIXES):
+                        return True
+        except OSError:
+            continue
+    return False
 
 
 def _find_archives(modality_dir: Path, dicom_dir: Path) -> list[Path]:
@@ -122,12 +132,12 @@ def _extract_archive(archive: Path, destination: Path) -> int:
     return _extract_tar(archive, destination)
 
 
-def _prepare_dicom_inputs(modality_dir: Path, dicom_dir: Path, logger) -> list[Path]:
-    """Extract supported archives and return recursive DICOM files."""
+def _prepare_dicom_inputs(modality_dir: Path, dicom_dir: Path, logger) -> bool:
+    """Extract supported archives and report whether DICOM files exist."""
     archives = _find_archives(modality_dir, dicom_dir)
     for archive in archives:
         destination = _archive_extract_dir(dicom_dir, archive)
-        if destination.exists() and any(destination.iterdir()):
+        if dir_has_entries(destination):
             logger.info(f"Using previously extracted {archive.name} at {destination}")
             continue
         try:
@@ -139,14 +149,14 @@ def _prepare_dicom_inputs(modality_dir: Path, dicom_dir: Path, logger) -> list[P
             f"Extracted {extracted} file(s) from {archive.name} to {destination}"
         )
 
-    dicom_files = _find_dicom_files(dicom_dir)
-    if dicom_files:
-        logger.info(f"Found {len(dicom_files)} DICOM file(s) under {dicom_dir}")
+    has_dicom = _has_dicom_files(dicom_dir)
+    if has_dicom:
+        logger.info(f"Found DICOM file(s) under {dicom_dir}")
     else:
         logger.info(
             f"No .dcm or .dicom files found under {dicom_dir}; skipping conversion"
         )
-    return dicom_files
+    return has_dicom
 
 
 def _modality_dicom_dir(sourcedata_dir: Path, modality: str) -> Path:
@@ -170,8 +180,7 @@ def _convert_modality(
 ) -> bool:
     """Convert DICOM files for a single modality to BIDS location."""
     modality_dir = dicom_dir.parent
-    dicom_files = _prepare_dicom_inputs(modality_dir, dicom_dir, logger)
-    if not dicom_files:
+    if not _prepare_dicom_inputs(modality_dir, dicom_dir, logger):
         return False
 
     bids_name = f"sub-{subject_id}_{modality}"
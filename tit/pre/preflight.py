@@ -12,7 +12,7 @@ from tit import constants as const
 from tit.paths import get_path_manager
 
 from .qsi.utils import validate_bids_dwi
-from .utils import _find_nifti
+from .utils import _find_nifti, dir_has_entries
 
 STEP_DICOM = "dicom"
 STEP_CHARM = "charm"
@@ -230,7 +230,7 @@ def _single_path_output(
 ) -> list[PreprocessingOutput]:
     # An empty directory is not a real output (older releases pre-created
     # empty per-subject freesurfer dirs in existing projects).
-    if not path.exists() or (path.is_dir() and not any(path.iterdir())):
+    if not path.exists() or (path.is_dir() and not dir_has_entries(path)):
         return []
     return [
         PreprocessingOutput(
@@ -14,7 +14,7 @@ from pathlib import Path
 
 from tit import constants as const
 from tit.paths import get_path_manager
-from tit.pre.utils import CommandRunner, PreprocessError
+from tit.pre.utils import CommandRunner, PreprocessError, dir_has_entries
 
 from .config import QSIPrepConfig, ResourceConfig
 from .docker_builder import DockerCommandBuilder, DockerBuildError
@@ -108,7 +108,7 @@ def run_qsiprep(
         output_dir = Path(pm.qsiprep_subject(subject_id))
         # Docker `-v` can leave an empty directory behind; only a non-empty
         # one is a real output.
-        if output_dir.exists() and any(output_dir.iterdir()):
+        if dir_has_entries(output_dir):
             raise PreprocessError(
                 f"QSIPrep output already exists at {output_dir}. "
                 "Remove the directory manually before rerunning."
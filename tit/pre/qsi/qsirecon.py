@@ -13,7 +13,7 @@ from pathlib import Path
 
 from tit import constants as const
 from tit.paths import get_path_manager
-from tit.pre.utils import CommandRunner, PreprocessError
+from tit.pre.utils import CommandRunner, PreprocessError, dir_has_entries
 
 from .config import QSIReconConfig, ResourceConfig
 from .docker_builder import DockerCommandBuilder, DockerBuildError
@@ -120,7 +120,7 @@ def run_qsirecon(
         )
         # Docker `-v` can leave an empty directory behind; only a non-empty
         # one is a real output.
-        if subject_output_dir.exists() and any(subject_output_dir.iterdir()):
+        if dir_has_entries(subject_output_dir):
             raise PreprocessError(
                 f"QSIRecon output already exists at {subject_output_dir}. "
                 "Remove the directory manually before rerunning."
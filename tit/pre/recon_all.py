@@ -26,7 +26,7 @@ import subprocess
 from pathlib import Path
 
 from tit.paths import get_path_manager
-from .utils import CommandRunner, PreprocessError, _find_anat_files
+from .utils import CommandRunner, PreprocessError, _find_anat_files, dir_has_entries
 
 
 def _run_subcortical_segmentations(
@@ -153,7 +153,7 @@ def run_recon_all(
             raise PreprocessError(f"No T1 file found in {bids_anat_dir}")
 
         if fs_subject_dir.exists():
-            if any(fs_subject_dir.iterdir()):
+            if dir_has_entries(fs_subject_dir):
                 raise PreprocessError(
                     f"FreeSurfer output already exists at {fs_subject_dir}. "
                     "Remove the directory manually before rerunning."
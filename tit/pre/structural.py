@@ -448,7 +448,8 @@ def run_pipeline(
     from tit.telemetry import track_operation
     from tit import constants as _const
 
-    subject_list = [str(s).strip() for s in subject_ids if str(s).strip()]
+    # filter(None, ...) drops empty IDs without re-stripping each one
+    subject_list = list(filter(None, (str(s).strip() for s in subject_ids)))
     if not subject_list:
         raise PreprocessError("No subjects provided.")
     if skip_existing_outputs and replace_existing_outputs:
@@ -17,12 +17,12 @@ See Also
 tit.pre : Package-level overview and convenience re-exports.
 """
 
-import glob
 import json
 import logging
 import os
 import signal
 import subprocess
+import sys
 import threading
 import time
 from collections import deque
@@ -58,6 +58,53 @@ class PreprocessCancelled(RuntimeError):
     """
 
 
+# File extensions accepted inside a sourcedata T1w/T2w modality directory.
+_SUPPORTED_MODALITY_FILES = (
+    ".dcm",
+    ".dicom",
+    ".zip",
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".json",
+    ".nii",
+    ".nii.gz",
+)
+
+
+def _sort_by_inode(entries: list[os.DirEntry]) -> None:
+    """Sort directory entries in place by inode number on Linux.
+
+    Visiting subdirectories in inode order clusters inode-table reads on
+    ext4/xfs, cutting cold-cache seek latency for cohort-sized project
+    directories. ``DirEntry.inode()`` comes straight from the dirent on
+    Unix; on other platforms it may cost a syscall, so this is a no-op
+    there. The caller sorts the discovered IDs before returning, so the
+    visit order never leaks into results.
+    """
+    if sys.platform.startswith("linux"):
+        entries.sort(key=lambda entry: entry.inode())
+
+
+def _modality_dir_has_data(modality_dir: str) -> bool:
+    """Return ``True`` if *modality_dir* holds any subdirectory or data file.
+
+    A single ``os.scandir`` pass replaces the previous
+    ``listdir`` + per-entry ``isdir`` combination, so each entry costs at
+    most one ``stat`` (and usually none, thanks to cached dirent types).
+    """
+    try:
+        with os.scandir(modality_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    return True
+                if entry.name.lower().endswith(_SUPPORTED_MODALITY_FILES):
+                    return True
+    except OSError:
+        pass
+    return False
+
+
 def discover_subjects(project_dir: str | None) -> list[str]:
     """Return sorted, deduplicated subject IDs found in a BIDS project tree.
 
@@ -88,77 +135,87 @@ def discover_subjects(project_dir: str | None) -> list[str]:
     if project_dir is None:
         return []
 
-    found: list[str] = []
+    found: set[str] = set()
 
     sourcedata_dir = os.path.join(project_dir, "sourcedata")
-    if os.path.exists(sourcedata_dir):
-        for subj_dir in glob.glob(os.path.join(sourcedata_dir, "sub-*")):
-            if os.path.isdir(subj_dir):
-                t1w_dir = os.path.join(subj_dir, "T1w")
-                t2w_dir = os.path.join(subj_dir, "T2w")
-
-                supported_modality_files = (
-                    ".dcm",
-                    ".dicom",
-                    ".zip",
-                    ".tar",
-                    ".tar.gz",
-                    ".tgz",
-                    ".json",
-                    ".nii",
-                    ".nii.gz",
-                )
-                has_valid_structure = (
-                    (
-                        os.path.exists(t1w_dir)
-                        and (
-                            any(
-                                os.path.isdir(os.path.join(t1w_dir, d))
-                                for d in os.listdir(t1w_dir)
-                            )
-                            or any(
-                                f.lower().endswith(supported_modality_files)
-                                for f in os.listdir(t1w_dir)
-                            )
-                        )
-                    )
-                    or (
-                        os.path.exists(t2w_dir)
-                        and (
-                            any(
-                                os.path.isdir(os.path.join(t2w_dir, d))
-                                for d in os.listdir(t2w_dir)
-                            )
-                            or any(
-                                f.lower().endswith(supported_modality_files)
-                                for f in os.listdir(t2w_dir)
-                            )
-                        )
-                    )
-                    or any(f.endswith(".tgz") for f in os.listdir(subj_dir))
-                )
+    try:
+        sourcedata_entries = list(os.scandir(sourcedata_dir))
+    except OSError:
+        sourcedata_entries = []
+    _sort_by_inode(sourcedata_entries)
+    for subj_entry in sourcedata_entries:
+        if not subj_entry.name.startswith("sub-") or not subj_entry.is_dir():
+            continue
+
+        has_tgz_bundle = False
+        try:
+            with os.scandir(subj_entry.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".tgz"):
+                        has_tgz_bundle = True
+                        break
+        except OSError:
+            continue
+
+        has_valid_structure = (
+            _modality_dir_has_data(os.path.join(subj_entry.path, "T1w"))
+            or _modality_dir_has_data(os.path.join(subj_entry.path, "T2w"))
+            or has_tgz_bundle
+        )
+        if has_valid_structure:
+            found.add(subj_entry.name.replace("sub-", ""))
 
-                if has_valid_structure:
-                    subject_id = os.path.basename(subj_dir).replace("sub-", "")
-                    found.append(subject_id)
-
-    for subj_dir in glob.glob(os.path.join(project_dir, "sub-*")):
-        if os.path.isdir(subj_dir):
-            subject_id = os.path.basename(subj_dir).replace("sub-", "")
-            if subject_id in found:
-                continue
-            anat_dir = os.path.join(subj_dir, "anat")
-            if os.path.exists(anat_dir):
+    try:
+        root_entries = list(os.scandir(project_dir))
+    except OSError:
+        root_entries = []
+    _sort_by_inode(root_entries)
+    for subj_entry in root_entries:
+        if not subj_entry.name.startswith("sub-") or not subj_entry.is_dir():
+            continue
+        subject_id = subj_entry.name.replace("sub-", "")
+        if subject_id in found:
+            continue
+        anat_dir = os.path.join(subj_entry.path, "anat")
+        try:
+            with os.scandir(anat_dir) as entries:
                 has_nifti = any(
-                    f.endswith((".nii", ".nii.gz")) and ("T1w" in f or "T2w" in f)
-                    for f in os.listdir(anat_dir)
+                    entry.name.endswith((".nii", ".nii.gz"))
+                    and ("T1w" in entry.name or "T2w" in entry.name)
+                    for entry in entries
                 )
-                if has_nifti:
-                    found.append(subject_id)
+        except OSError:
+            continue
+        if has_nifti:
+            found.add(subject_id)
 
     return sorted(found)
 
 
+def dir_has_entries(path: str | Path) -> bool:
+    """Return ``True`` if *path* is a directory containing at least one entry.
+
+    Probes with a single ``os.scandir`` iteration instead of reading the
+    whole listing, so it stays cheap on directories with many files
+    (e.g. DICOM series). Missing or unreadable paths count as empty.
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory to probe.
+
+    Returns
+    -------
+    bool
+        ``True`` if at least one directory entry exists.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return next(iter(entries), None) is not None
+    except OSError:
+        return False
+
+
 def check_m2m_exists(project_dir: str, subject_id: str) -> bool:
     """Return ``True`` if the SimNIBS m2m directory already exists.
 
@@ -222,29 +279,24 @@ def ensure_subject_dirs(project_dir: str, subject_id: str) -> None:
     pm.ensure(pm.ti_toolbox())
 
 
+# Subdirectory (relative to the project root) holding each dataset's
+# dataset_description.json. Keeping this as a table makes the lookup O(1)
+# and adding a new derivative dataset a one-line change.
+_DATASET_DESCRIPTION_SUBDIRS: dict[str, tuple[str, ...]] = {
+    "root": (),
+    "freesurfer": ("derivatives", "freesurfer"),
+    "simnibs": ("derivatives", "SimNIBS"),
+    "ti-toolbox": ("derivatives", "ti-toolbox"),
+}
+
+
 def _dataset_description_target(project_dir: str, dataset: str) -> Path:
     """Return the target path for a dataset_description.json file."""
-    if dataset == "root":
-        return Path(project_dir) / "dataset_description.json"
-    if dataset == "freesurfer":
-        return (
-            Path(project_dir)
-            / "derivatives"
-            / "freesurfer"
-            / "dataset_description.json"
-        )
-    if dataset == "simnibs":
-        return (
-            Path(project_dir) / "derivatives" / "SimNIBS" / "dataset_description.json"
-        )
-    if dataset == "ti-toolbox":
-        return (
-            Path(project_dir)
-            / "derivatives"
-            / "ti-toolbox"
-            / "dataset_description.json"
-        )
-    raise ValueError(f"Unknown dataset: {dataset}")
+    try:
+        subdirs = _DATASET_DESCRIPTION_SUBDIRS[dataset]
+    except KeyError:
+        raise ValueError(f"Unknown dataset: {dataset}") from None
+    return Path(project_dir).joinpath(*subdirs, "dataset_description.json")
 
 
 def ensure_dataset_descriptions(project_dir: str, datasets: Iterable[str]) -> None:
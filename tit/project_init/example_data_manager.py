@@ -10,6 +10,7 @@ use in TI-Toolbox workflows.
 Author: TI-Toolbox Development Team
 """
 
+import json
 import os
 import shutil
 import logging
@@ -301,9 +302,7 @@ class ExampleDataManager:
             }
 
             with open(desc_file, "w") as f:
-                import json
-
-                json.dump(dataset_desc, f, indent=2)
+                f.write(json.dumps(dataset_desc, indent=2))
 
             logger.info("Created BIDS dataset_description.json")
 
@@ -365,6 +365,13 @@ _CA_BUNDLE_PATHS = (
 )
 
 
+# Cached result of _ssl_context() — the CA situation cannot change within a
+# process, so the context (and the CA-bundle probing behind it) is resolved
+# at most once.  ``None`` is a valid cached value, hence the sentinel.
+_SSL_CONTEXT_UNSET = object()
+_cached_ssl_context: ssl.SSLContext | None | object = _SSL_CONTEXT_UNSET
+
+
 def _ssl_context() -> ssl.SSLContext | None:
     """Return an SSL context that can verify GA4's certificate.
 
@@ -374,8 +381,18 @@ def _ssl_context() -> ssl.SSLContext | None:
 
     Returns ``None`` (use default context) when certs are fine,
     or a configured :class:`ssl.SSLContext` when a system bundle was
-    found.
+    found.  The result is computed once per process and reused for
+    every subsequent event.
     """
+    global _cached_ssl_context
+    if _cached_ssl_context is not _SSL_CONTEXT_UNSET:
+        return _cached_ssl_context  # type: ignore[return-value]
+    _cached_ssl_context = _build_ssl_context()
+    return _cached_ssl_context
+
+
+def _build_ssl_context() -> ssl.SSLContext | None:
+    """Build the SSL context for GA4 requests (uncached)."""
     # Fast path: default context works
     ctx = ssl.create_default_context()
     if ctx.get_ca_certs():
@@ -395,6 +412,14 @@ def _ssl_context() -> ssl.SSLContext | None:
     return ctx
 
 
+# The endpoint never changes within a process, so build the URL once.
+_GA4_URL = (
+    f"{const.GA4_ENDPOINT}"
+    f"?measurement_id={const.GA4_MEASUREMENT_ID}"
+    f"&api_secret={const.GA4_API_SECRET}"
+)
+
+
 def _send_ga4(payload: dict[str, Any]) -> None:
     """POST a JSON payload to the GA4 Measurement Protocol endpoint.
 
@@ -406,14 +431,9 @@ def _send_ga4(payload: dict[str, Any]) -> None:
     payload : dict
         GA4 MP JSON body (must include ``client_id`` and ``events``).
     """
-    url = (
-        f"{const.GA4_ENDPOINT}"
-        f"?measurement_id={const.GA4_MEASUREMENT_ID}"
-        f"&api_secret={const.GA4_API_SECRET}"
-    )
     data = json.dumps(payload).encode("utf-8")
     req = urllib.request.Request(
-        url,
+        _GA4_URL,
         data=data,
         headers={"Content-Type": "application/json"},
         method="POST",